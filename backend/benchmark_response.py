@@ -0,0 +1,85 @@
+"""
+Benchmark /generate response serialization and bytes-on-wire.
+
+Compares the current handler path (FastAPI serializing the /generate response_model)
+against field-selected responses, and reports compressed sizes. Runs offline on a synthetic response - no API key needed.
+
+Usage: python -m backend.benchmark_response
+"""
+import asyncio
+import gzip
+import random
+import time
+
+from fastapi.routing import serialize_response
+
+from backend.main import BROTLI_QUALITY, COMPRESSION_MIN_SIZE, GenerateResponse, app, select_response_fields
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ITERATIONS = 2000
+WORDS = "the experts weighed trade-offs proposal detail citing sources caveats risk evidence model policy cost benefit users data".split()
+
+def paragraph(rng, words=600):
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+def build_response():
+    rng = random.Random(0)
+    return GenerateResponse(
+        consensus=paragraph(rng),
+        expert_responses={name: paragraph(rng) for name in ["Creative Expert", "Logical Expert", "Ethical Expert"]},
+        reasoning=paragraph(rng),
+        agreements=[f"Agreement point {i}" for i in range(10)],
+        disagreements=[f"Disagreement point {i}" for i in range(5)],
+        controversy_score=0.35,
+        confidence_score=0.82,
+        hallucination_risk="Low",
+        verified_facts=[f"Verified fact {i}" for i in range(10)],
+        unverified_claims=[f"Unverified claim {i}" for i in range(5)],
+    )
+
+# The same ModelField FastAPI uses to validate and serialize the /generate route
+RESPONSE_FIELD = next(route.response_field for route in app.routes if getattr(route, "path", None) == "/generate")
+
+def compact_body(response, fields=None, exclude=None):
+    return select_response_fields(response, fields, exclude).body
+
+def timed(fn):
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        body = fn()
+    return (time.perf_counter() - start) / ITERATIONS * 1e6, body
+
+async def timed_baseline(response):
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        body = await serialize_response(field=RESPONSE_FIELD, response_content=response, dump_json=True)
+    return (time.perf_counter() - start) / ITERATIONS * 1e6, body
+
+def wire_size(body, compress):
+    # Mirror the middleware: bodies under the threshold are sent as-is
+    return len(body) if len(body) < COMPRESSION_MIN_SIZE else len(compress(body))
+
+def report(name, micros, body):
+    # Same settings the server uses: starlette gzip level 9, brotli-asgi text mode at BROTLI_QUALITY
+    gz = wire_size(body, lambda b: gzip.compress(b, compresslevel=9))
+    br = wire_size(body, lambda b: brotli.compress(b, mode=brotli.MODE_TEXT, quality=BROTLI_QUALITY, lgwin=22)) if brotli else "n/a"
+    print(f"{name:40} {micros:8.1f} {len(body):8} {gz:8} {br:>8}")
+
+def main():
+    response = build_response()
+    cases = [
+        ("exclude experts+reasoning", lambda: compact_body(response, exclude=["expert_responses", "reasoning"])),
+        ("fields=[consensus]", lambda: compact_body(response, fields=["consensus"])),
+    ]
+
+    print(f"{'case':40} {'us/op':>8} {'raw':>8} {'gzip':>8} {'brotli':>8}")
+    report("current handler (all fields)", *asyncio.run(timed_baseline(response)))
+    for name, fn in cases:
+        report(name, *timed(fn))
+
+if __name__ == "__main__":
+    main()
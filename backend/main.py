@@ -1,11 +1,23 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from dotenv import load_dotenv
 import os
 from pathlib import Path
 
+# Optional brotli support - fall back to gzip if missing
+try:
+    from brotli_asgi import BrotliMiddleware
+except ImportError:
+    BrotliMiddleware = None
+
+# Responses smaller than this are sent uncompressed
+COMPRESSION_MIN_SIZE = int(os.environ.get("COMPRESSION_MIN_SIZE", "1024"))
+# brotli-asgi defaults to quality 4, which is larger than gzip level 9 on /generate bodies
+BROTLI_QUALITY = int(os.environ.get("BROTLI_QUALITY", "7"))
+
 load_dotenv()
 
 app = FastAPI(title="Neural Consensus Engine API")
@@ -19,7 +31,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-from pydantic import BaseModel
+# Compress large responses (brotli when available, gzip otherwise)
+if BrotliMiddleware is not None:
+    app.add_middleware(BrotliMiddleware, quality=BROTLI_QUALITY, minimum_size=COMPRESSION_MIN_SIZE, gzip_fallback=True)
+else:
+    app.add_middleware(GZipMiddleware, minimum_size=COMPRESSION_MIN_SIZE)
+
+from pydantic import BaseModel, field_validator, model_validator
 from backend.core.orchestrator import create_consensus_graph
 
 class GenerateRequest(BaseModel):
@@ -33,6 +51,29 @@ class GenerateRequest(BaseModel):
     target_audience: str = "General"
     expert_weights: dict[str, float] = {"Creative Expert": 1.0, "Logical Expert": 1.0, "Ethical Expert": 1.0}
     expert_configs: dict[str, dict] = {}
+    # Response field selection, e.g. fields=["consensus"] or exclude=["expert_responses", "reasoning"]
+    fields: list[str] | None = None
+    exclude: list[str] | None = None
+
+    @field_validator("fields", "exclude")
+    @classmethod
+    def check_response_fields(cls, value: list[str] | None) -> list[str] | None:
+        if value is None:
+            return value
+        if not value:
+            raise ValueError("must name at least one response field, or be omitted")
+        unknown = set(value) - set(GenerateResponse.model_fields)
+        if unknown:
+            raise ValueError(f"unknown response fields: {', '.join(sorted(unknown))}")
+        return value
+
+    @model_validator(mode="after")
+    def check_response_selection(self):
+        if self.fields is not None and self.exclude is not None:
+            raise ValueError("use either fields or exclude, not both")
+        if self.exclude is not None and set(self.exclude) >= set(GenerateResponse.model_fields):
+            raise ValueError("exclude must leave at least one response field")
+        return self
 
 class GenerateResponse(BaseModel):
     consensus: str
@@ -46,12 +87,25 @@ class GenerateResponse(BaseModel):
     verified_facts: list[str] = []
     unverified_claims: list[str] = []
 
+def select_response_fields(response: GenerateResponse, fields: list[str] | None = None, exclude: list[str] | None = None) -> Response:
+    """Serialize only the requested fields of a response to JSON."""
+    body = response.model_dump_json(
+        include=set(fields) if fields is not None else None,
+        exclude=set(exclude) if exclude is not None else None,
+    )
+    return Response(content=body, media_type="application/json")
+
 # API routes must come BEFORE static file serving
 @app.get("/status")
 async def get_status():
     return {"status": "operational", "service": "Neural Consensus Engine"}
 
-@app.post("/generate", response_model=GenerateResponse)
+@app.post(
+    "/generate",
+    response_model=GenerateResponse,
+    description="Returns every GenerateResponse field by default. When `fields` or `exclude` "
+                "is set, only the selected fields are returned, so required fields may be absent.",
+)
 async def generate_consensus(request: GenerateRequest):
     print(f"Received request: {request.query}")
     graph = create_consensus_graph()
@@ -68,7 +122,7 @@ async def generate_consensus(request: GenerateRequest):
         "expert_configs": request.expert_configs
     })
     
-    return GenerateResponse(
+    response = GenerateResponse(
         consensus=result["final_consensus"],
         expert_responses=result["expert_responses"],
         reasoning=result.get("reasoning", "No specific reasoning provided."),
@@ -80,6 +134,10 @@ async def generate_consensus(request: GenerateRequest):
         verified_facts=result.get("verified_facts", []),
         unverified_claims=result.get("unverified_claims", [])
     )
+    # Without a selection, let FastAPI validate and serialize against response_model
+    if request.fields is None and request.exclude is None:
+        return response
+    return select_response_fields(response, request.fields, request.exclude)
 
 # Serve frontend static files
 # Check both container path (/app/frontend/dist) and local dev path
@@ -0,0 +1,80 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import backend.main
+import backend.main_production
+
+RESULT = {
+    "final_consensus": "consensus " * 300,
+    "expert_responses": {"Logical Expert": "logic " * 300},
+    "reasoning": "because",
+    "agreements": ["a"],
+}
+
+
+class StubGraph:
+    async def ainvoke(self, state):
+        return RESULT
+
+
+@pytest.fixture(params=[backend.main, backend.main_production], ids=["main", "main_production"])
+def module(request, monkeypatch):
+    monkeypatch.setattr(request.param, "create_consensus_graph", lambda: StubGraph())
+    return request.param
+
+
+@pytest.fixture
+def client(module):
+    return TestClient(module.app)
+
+
+def test_no_selection_returns_full_model(client, module):
+    response = client.post("/generate", json={"query": "q"})
+    assert response.status_code == 200
+    body = response.json()
+    assert set(body) == set(module.GenerateResponse.model_fields)
+    assert body["reasoning"] == "because"
+    assert body["disagreements"] == []
+
+
+def test_fields_keeps_only_selected(client):
+    response = client.post("/generate", json={"query": "q", "fields": ["consensus", "agreements"]})
+    assert response.status_code == 200
+    assert response.json() == {"consensus": RESULT["final_consensus"], "agreements": ["a"]}
+
+
+def test_exclude_drops_selected(client, module):
+    response = client.post("/generate", json={"query": "q", "exclude": ["expert_responses", "reasoning"]})
+    assert response.status_code == 200
+    assert set(response.json()) == set(module.GenerateResponse.model_fields) - {"expert_responses", "reasoning"}
+
+
+@pytest.mark.parametrize("selection", [
+    {"fields": ["bogus"]},
+    {"exclude": ["bogus"]},
+    {"fields": []},
+    {"exclude": []},
+    {"fields": ["consensus"], "exclude": ["reasoning"]},
+])
+def test_invalid_selection_is_rejected(client, selection):
+    response = client.post("/generate", json={"query": "q", **selection})
+    assert response.status_code == 422
+    assert isinstance(response.json()["detail"], list)
+
+
+def test_excluding_every_field_is_rejected(client, module):
+    response = client.post("/generate", json={"query": "q", "exclude": list(module.GenerateResponse.model_fields)})
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize("encoding", ["br", "gzip"])
+def test_large_response_is_compressed(client, module, encoding):
+    response = client.post("/generate", json={"query": "q"}, headers={"Accept-Encoding": encoding})
+    assert len(response.content) > module.COMPRESSION_MIN_SIZE
+    assert response.headers["content-encoding"] == encoding
+
+
+def test_small_response_is_not_compressed(client):
+    response = client.post("/generate", json={"query": "q", "fields": ["reasoning"]}, headers={"Accept-Encoding": "br, gzip"})
+    assert "content-encoding" not in response.headers
+    assert response.json() == {"reasoning": "because"}